@@ -1,10 +1,21 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, replace
 from typing import Optional, Dict, Any, Tuple, List
-import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import functools
+import hashlib
+import itertools
 import json
 import math
+import os
+import shutil
+import struct
+import threading
+import warnings
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -15,6 +26,13 @@ try:
 except Exception:
     _HAS_PIL = False
 
+# Prefer orjson for parsing API responses (parses bytes directly), fall back to stdlib json.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # -------------------------
 # Low-level API Structures
 # -------------------------
@@ -29,6 +47,10 @@ class PlaneInfo:
     image: Optional["Image.Image"] = None
     image_marked: Optional["Image.Image"] = None
 
+# Plane order used for (entry, plane) indexed arrays
+PLANES = ("coronal", "sagittal", "horizontal")
+_CORONAL, _HORIZONTAL = PLANES.index("coronal"), PLANES.index("horizontal")
+
 # Bundle the three planes together that the API returns
 @dataclass
 class AtlasResponse:
@@ -64,6 +86,22 @@ class AtlasResponse:
             horizontal=_plane("horizontal"),
         )
 
+    def copy(self):
+        """
+        Copy with independent plane images, so markers can be drawn on each copy separately
+        """
+        def _plane(p: PlaneInfo):
+            image = p.image.copy() if p.image is not None else None
+            marked = p.image_marked
+            if marked is not None:
+                marked = image if marked is p.image else marked.copy()
+            return replace(p, image=image, image_marked=marked)
+        return AtlasResponse(
+            coronal=_plane(self.coronal),
+            sagittal=_plane(self.sagittal),
+            horizontal=_plane(self.horizontal),
+        )
+
     def as_dict(self):
         """
         Convert AtlasResponse into dict
@@ -77,45 +115,145 @@ class AtlasResponse:
 
 API_BASE = "http://labs.gaidi.ca/rat-brain-atlas/api.php"
 
+# Up to 6 queries (bottom + top rows), each fanning out to 3 plane images, can be in flight at once
+_MAX_QUERIES = 6
+_MAX_IMAGES = 3 * _MAX_QUERIES
+
+# One session for every request so connections to the atlas host are kept alive and reused
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(_scheme, HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=_MAX_QUERIES + _MAX_IMAGES,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ))
+
+# Shared worker pools: requests are network-bound, so threads overlap their latency.
+# Queries and image downloads get separate pools so a query waiting on its images never starves them.
+_QUERY_POOL = ThreadPoolExecutor(max_workers=_MAX_QUERIES, thread_name_prefix="atlas-query")
+_IMAGE_POOL = ThreadPoolExecutor(max_workers=_MAX_IMAGES, thread_name_prefix="atlas-image")
+
+# On-disk cache for API responses and plane images (the atlas is deterministic in ml/ap/dv)
+CACHE_DIR = Path(os.environ.get("RAT_ATLAS_CACHE", Path.home() / ".cache" / "rat_atlas"))
+
+def _tmp_path(path: Path):
+    """Per-thread scratch file next to a cache entry, renamed into place once complete"""
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+def _write_cache(path: Path, data: bytes):
+    """Atomically write bytes to the cache, ignoring unwritable cache dirs"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _tmp_path(path)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _discard(path: Path):
+    """Remove a cache file, ignoring missing files and unusable cache dirs"""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+def _stream_to_file(stream, path: Path):
+    """Copy a response stream into a file. Returns False (stream untouched) if the file cannot be created"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, "wb")
+    except OSError:
+        return False
+    with f:
+        shutil.copyfileobj(stream, f)
+    return True
+
 def atlas_url(ml: float, ap: float, dv: float):
     """Build query URL for atlas API"""
     return f"{API_BASE}?ml={ml}&ap={ap}&dv={dv}"
 
-def _webread(url: str):
-    """Fetch raw bytes from URL with timeout"""
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    return r.content
+def _webread(url: str, params: Optional[Dict[str, Any]] = None):
+    """Fetch raw bytes from URL with timeout, streamed into a single preallocated buffer"""
+    with _SESSION.get(url, params=params, stream=True, timeout=30) as r:
+        r.raise_for_status()
+        # Content-Length is the encoded size, so only size the buffer up front for identity bodies
+        n = 0 if r.headers.get("Content-Encoding") else int(r.headers.get("Content-Length") or 0)
+        buf = bytearray(n)
+        off = 0
+        for chunk in r.iter_content(65536):
+            end = off + len(chunk)
+            buf[off:end] = chunk  # in place while within n, grows the buffer past it
+            off = end
+        del buf[off:]
+        return buf
+
+def _decode_image(fp):
+    """Decode an image eagerly, so the work happens in the calling worker thread rather than on first draw"""
+    img = Image.open(fp)
+    img.draft("RGB", img.size)  # Lets JPEG sources decode straight to RGB; no-op for PNG
+    img.load()
+    # Atlas PNGs are usually RGB already, so avoid a full-image copy when they are
+    return img if img.mode == "RGB" else img.convert("RGB")
 
 def _read_image(url: str):
-    """Download image and return a Pillow image"""
+    """Download image (streamed through the on-disk cache) and return a Pillow image"""
+    path = CACHE_DIR / (hashlib.sha1(url.encode()).hexdigest() + ".png")
+
+    # Cache hit; a missing, unreadable or corrupt entry is treated as a miss (and dropped if possible)
     try:
-        data = _webread(url)
-        return Image.open(io.BytesIO(data)).convert("RGB")
+        return _decode_image(path)
+    except Exception:
+        _discard(path)
+
+    tmp = _tmp_path(path)
+    try:
+        with _SESSION.get(url, stream=True, timeout=30) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            if not _stream_to_file(r.raw, tmp):
+                # Cache unwritable: decode straight from the response stream
+                return _decode_image(r.raw)
+        # Only bodies that decode (not e.g. an HTML error page) are moved into the cache
+        img = _decode_image(tmp)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        return img
     except Exception:
         return None
+    finally:
+        _discard(tmp)
 
 
-def rat_brain_atlas(ml: float, ap: float, dv: float):
-    """Query atlas API for c/s/h planes"""
+@functools.lru_cache(maxsize=256)
+def _query_atlas(ml: float, ap: float, dv: float):
+    """Fetch and parse atlas JSON for a coordinate, reading through the on-disk cache"""
 
-    # Fetch url
-    url = atlas_url(ml, ap, dv)
+    # Cache hit
+    key = hashlib.blake2b(struct.pack("ddd", ml, ap, dv), digest_size=8).hexdigest()
+    path = CACHE_DIR / f"{key}.json"
     try:
-        r = requests.get(url, timeout=30)
-        r.raise_for_status()
+        return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    # Fetch url (requests encodes the query string)
+    try:
+        content = _webread(API_BASE, params={"ml": ml, "ap": ap, "dv": dv})
     except Exception as e:
-        raise RuntimeError(f"Unable to complete web request to {url!r}.") from e
+        raise RuntimeError(f"Unable to complete web request to {atlas_url(ml, ap, dv)!r}.") from e
 
     # JSON Parse
     try:
-        d = r.json()  # Fast path
+        d = _loads(content)  # Fast path
     except ValueError:
-        # If no JSON headers (might be deprecated)
+        # Tolerate malformed UTF-8 in the response body
         try:
-            d = json.loads(r.content.decode("utf-8", errors="replace"))
+            d = _loads(content.decode("utf-8", errors="replace"))
         except Exception as e:
-            sample = r.content[:200]
+            sample = bytes(content[:200])
             raise RuntimeError(
                 "Failed to parse JSON from atlas API. "
                 f"First 200 bytes of response: {sample!r}"
@@ -125,23 +263,43 @@ def rat_brain_atlas(ml: float, ap: float, dv: float):
     if isinstance(d, dict) and d.get("error"):
         raise RuntimeError(f"Atlas API error: {d.get('error')}")
 
+    # Only valid responses are written through
+    _write_cache(path, content)
+    return d
+
+
+def _load_plane(plane: PlaneInfo, mark: bool):
+    """Fetch a plane's image and, if Pillow is present and mark is set, overlay the implant location"""
+    plane.image = _read_image(plane.image_url)
+    if _HAS_PIL and mark and plane.image is not None:
+        plane.image_marked = _stamp_markers(plane.image, [(plane.left, plane.top, 10)])
+
+
+def rat_brain_atlas(
+    ml: float,
+    ap: float,
+    dv: float,
+    *,
+    mark: bool = True,
+    planes: Tuple[str, ...] = PLANES,
+):
+    """
+    Query atlas API for c/s/h planes
+
+    Markers are drawn directly onto the fetched images (image_marked is the same object as image).
+    Pass mark=False to leave the images untouched, e.g. when the caller draws its own markers.
+    Only the planes named in `planes` have their images fetched; the others keep image=None.
+    """
+    unknown = set(planes) - set(PLANES)
+    if unknown:
+        raise ValueError(f"Unknown planes {sorted(unknown)}, expected a subset of {PLANES}")
+
     # Get dataclasses from JSON
-    slice_views = AtlasResponse.from_json(d)
-
-    # Fetch plane images
-    for plane in (slice_views.coronal, slice_views.sagittal, slice_views.horizontal):
-        plane.image = _read_image(plane.image_url)
-
-    # If Pillow is present, overlay implant locations
-    if _HAS_PIL:
-        for plane in (slice_views.coronal, slice_views.sagittal, slice_views.horizontal):
-            if plane.image is not None:
-                im = plane.image.copy()
-                draw = ImageDraw.Draw(im)
-                rpx = 10
-                x, y = plane.left, plane.top
-                draw.ellipse((x - rpx, y - rpx, x + rpx, y + rpx), fill=(255, 0, 0))
-                plane.image_marked = im
+    slice_views = AtlasResponse.from_json(_query_atlas(ml, ap, dv))
+
+    # Fetch (and mark) requested plane images concurrently, one pass per plane
+    selected = [getattr(slice_views, name) for name in planes]
+    list(_IMAGE_POOL.map(functools.partial(_load_plane, mark=mark), selected))
 
     return slice_views
 
@@ -152,53 +310,114 @@ def rat_brain_atlas(ml: float, ap: float, dv: float):
 
 @dataclass
 class CombinedAtlas:
-    """Container mimicking the MATLAB combined struct list"""
+    """
+    Container mimicking the MATLAB combined struct list
+
+    Marker pixel coordinates are also kept as (entry, plane) arrays, with planes ordered as PLANES.
+    """
     entries: List[AtlasResponse]
+    tops: np.ndarray = field(init=False, repr=False)
+    lefts: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # One walk over the planes at construction; top/left never change after from_json
+        planes = [(entry.coronal, entry.sagittal, entry.horizontal) for entry in self.entries]
+        self.tops = np.array([[p.top for p in row] for row in planes], dtype=int).reshape(-1, len(PLANES))
+        self.lefts = np.array([[p.left for p in row] for row in planes], dtype=int).reshape(-1, len(PLANES))
+
+    def markers(self, plane: int, radius_px: float):
+        """List of (x, y, r) markers, one per entry, on one plane (index into PLANES)"""
+        return [
+            (x, y, radius_px)
+            for x, y in zip(self.lefts[:, plane].tolist(), self.tops[:, plane].tolist())
+        ]
 
 def _consolidate(Sleft: AtlasResponse, Scenter: AtlasResponse, Sright: AtlasResponse):
     """Wrap CombinedAtlases"""
     return CombinedAtlas(entries=[Sleft, Scenter, Sright])
 
+@functools.lru_cache(maxsize=8)
+def _marker_stamp(r: int):
+    """Red disc of radius r on a transparent (2r+1, 2r+1) RGBA tile, pasted using its own alpha"""
+    stamp = Image.new("RGBA", (2 * r + 1, 2 * r + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(stamp).ellipse((0, 0, 2 * r, 2 * r), fill=(255, 0, 0, 255))
+    return stamp
+
+def _stamp_markers(im: "Image.Image", markers: List[Tuple[int, int, float]]):
+    """Paint a red disc at each (x, y, r) in place (paste clips stamps at the image edges)"""
+    for (x, y, r) in markers:
+        r = int(round(r))  # stamps are whole pixels; accept float radii as ImageDraw did
+        stamp = _marker_stamp(r)
+        im.paste(stamp, (x - r, y - r), stamp)
+    return im
+
 def _insert_markers_on_planes(
     atlas_struct: CombinedAtlas,
     radius_px: int,
     multi_mark_horizontal: Optional[List[Tuple[int, int, int]]] = None,
 ):
     """
-    Adds red markers:
+    Adds red markers, drawn in place on each plane image:
       - Coronal: mark electrode
       - Horizontal: mark all provided coords
     """
     if not _HAS_PIL:
         return atlas_struct  # No Pillow
 
-    for entry in atlas_struct.entries:
+    coronal = atlas_struct.markers(_CORONAL, radius_px)
+    horizontal = atlas_struct.markers(_HORIZONTAL, radius_px)
+    for entry, coronal_marker, horizontal_marker in zip(atlas_struct.entries, coronal, horizontal):
         # Coronal: one marker per entry
         if entry.coronal.image is not None:
-            im = entry.coronal.image.copy()
-            d = ImageDraw.Draw(im)
-            x, y = entry.coronal.left, entry.coronal.top
-            d.ellipse((x - radius_px, y - radius_px, x + radius_px, y + radius_px), fill=(255, 0, 0))
-            entry.coronal.image_marked = im
+            entry.coronal.image_marked = _stamp_markers(entry.coronal.image, [coronal_marker])
 
         # Horizontal: L/C/R or just original entry
         if entry.horizontal.image is not None:
-            im = entry.horizontal.image.copy()
-            d = ImageDraw.Draw(im)
-            if multi_mark_horizontal:
-                for (x, y, r) in multi_mark_horizontal:
-                    d.ellipse((x - r, y - r, x + r, y + r), fill=(255, 0, 0))
-            else:
-                x, y = entry.horizontal.left, entry.horizontal.top
-                d.ellipse((x - radius_px, y - radius_px, x + radius_px, y + radius_px), fill=(255, 0, 0))
-            entry.horizontal.image_marked = im
+            markers = multi_mark_horizontal or [horizontal_marker]
+            entry.horizontal.image_marked = _stamp_markers(entry.horizontal.image, markers)
     return atlas_struct
 
+def _mosaic(cells: List[List[Optional["Image.Image"]]]):
+    """
+    Paste a grid of plane images (rows of columns) into one RGB canvas
+
+    Each column is as wide as its widest image and each row as tall as its tallest, with every image
+    centred in its cell; missing images leave a white cell.
+    Returns (mosaic, centres) with centres[i][j] the pixel centre of cell (i, j), or (None, None)
+    if there is nothing to paste.
+    """
+    present = [im for row in cells for im in row if im is not None]
+    if not _HAS_PIL or not present:
+        return None, None
+
+    # Rows/columns without any image fall back to the largest image's size
+    default_w = max(im.width for im in present)
+    default_h = max(im.height for im in present)
+    col_w = [
+        max((row[j].width for row in cells if row[j] is not None), default=default_w)
+        for j in range(len(cells[0]))
+    ]
+    row_h = [max((im.height for im in row if im is not None), default=default_h) for row in cells]
+    x0 = [0, *itertools.accumulate(col_w)]
+    y0 = [0, *itertools.accumulate(row_h)]
+
+    mosaic = Image.new("RGB", (x0[-1], y0[-1]), (255, 255, 255))
+    for i, row in enumerate(cells):
+        for j, im in enumerate(row):
+            if im is not None:
+                mosaic.paste(im, (x0[j] + (col_w[j] - im.width) // 2, y0[i] + (row_h[i] - im.height) // 2))
+    centres = [[(x0[j] + col_w[j] / 2, y0[i] + row_h[i] / 2) for j in range(len(col_w))] for i in range(len(row_h))]
+    return mosaic, centres
+
 
 def _sind(deg: float):
+    """Deprecated: plot_implant_coords converts the angle to radians once itself"""
+    warnings.warn("_sind is deprecated, use math.sin(math.radians(deg))", DeprecationWarning, stacklevel=2)
     return math.sin(math.radians(deg))
 
 def _cosd(deg: float):
+    """Deprecated: plot_implant_coords converts the angle to radians once itself"""
+    warnings.warn("_cosd is deprecated, use math.cos(math.radians(deg))", DeprecationWarning, stacklevel=2)
     return math.cos(math.radians(deg))
 
 
@@ -211,7 +430,8 @@ def plot_implant_coords(
     span: float = 750.0,       # microns
     skull_t: float = 500.0,    # microns
     vert_span: float = float("nan"),  # microns
-    plot_radius: int = 5       # pixels for drawn circle
+    plot_radius: int = 5,      # pixels for drawn circle
+    reuse_figure: bool = False,  # update the previous call's open figures in place
 ):
     """
     Python port of plot_implant_coords. Returns (s_comb_bot, s_comb_top).
@@ -220,6 +440,10 @@ def plot_implant_coords(
     Units:
       - AP/ML/DV: mm
       - span, skull_t, vert_span: microns
+
+    reuse_figure is meant for loops/GUIs that keep one figure on screen: it redraws the figures from the
+    previous reuse_figure call instead of creating new ones. Leave it off in notebooks, where a reused
+    figure is not shown again in the new cell's output.
     """
     # Convert microns to mm
     span_mm = span / 1000.0
@@ -227,91 +451,112 @@ def plot_implant_coords(
     vert_mm = (vert_span / 1000.0) if not math.isnan(vert_span) else float("nan")
     #angle = -float(angle)  # flip rotation sense: +θ now behaves like previous -θ
 
-    # Bottom (tip) coordinates in mm (center and r/l offsets with angle)
-    center_bot = np.array([AP, ML, DV + skull_mm])
-    left_bot   = np.array([AP - _sind(-angle) * span_mm / 2.0,
-                           ML - _cosd(-angle) * span_mm / 2.0,
-                           DV + skull_mm])
-    right_bot  = np.array([AP + _sind(-angle) * span_mm / 2.0,
-                           ML + _cosd(-angle) * span_mm / 2.0,
-                           DV + skull_mm])
-
-    # Optional top coordinates if vert_span is provided
-    if not math.isnan(vert_span):
-        center_top = center_bot - np.array([0.0, 0.0, vert_mm])
-        left_top   = left_bot   - np.array([0.0, 0.0, vert_mm])
-        right_top  = right_bot  - np.array([0.0, 0.0, vert_mm])
-    else:
-        center_top = left_top = right_top = None
+    # Bottom (tip) coordinates in mm: rows are left/center/right, columns AP/ML/DV
+    theta = math.radians(-angle)
+    s_half = math.sin(theta) * span_mm / 2.0
+    c_half = math.cos(theta) * span_mm / 2.0
+    offsets = np.array([[-s_half, -c_half, 0.0],
+                        [    0.0,     0.0, 0.0],
+                        [ s_half,  c_half, 0.0]])
+    coords = np.array([AP, ML, DV + skull_mm]) + offsets
+
+    # Optional top coordinates if vert_span is provided (appended as rows 3-5)
+    has_top = not math.isnan(vert_span)
+    if has_top:
+        coords = np.vstack([coords, coords - np.array([0.0, 0.0, vert_mm])])
 
     # Helper to query one coordinate triple (note ML/AP/DV order for API)
     def S_at(coords) -> AtlasResponse:
         ap, ml, dv = float(coords[0]), float(coords[1]), float(coords[2])
-        return rat_brain_atlas(ml=ml, ap=ap, dv=dv)
+        # Only coronal and horizontal planes are plotted, so skip the sagittal download
+        return rat_brain_atlas(ml=ml, ap=ap, dv=dv, mark=False, planes=("coronal", "horizontal"))
+
+    # Issue every distinct query at once (bottom row, then top row if requested).
+    # Coordinates that coincide at 1 micron (span of 0, or a vert_span of 0 between rows) share one fetch.
+    keys = [tuple(round(float(v), 3) for v in row) for row in coords]
+    first: Dict[Tuple[float, ...], np.ndarray] = {}
+    for key, row in zip(keys, coords):
+        first.setdefault(key, row)
+    fetched = dict(zip(first, _QUERY_POOL.map(S_at, first.values())))
+
+    # Markers are drawn in place, so repeat consumers of a fetch get their own image copies
+    results, seen = [], set()
+    for key in keys:
+        results.append(fetched[key].copy() if key in seen else fetched[key])
+        seen.add(key)
 
-    s_left = S_at(left_bot)
-    s_center = S_at(center_bot)
-    s_right  = S_at(right_bot)
+    s_left, s_center, s_right = results[:3]
 
     # Consolidate and add markers
     s_comb_bot = _consolidate(s_left, s_center, s_right)
 
     # For horizontal images, insert all three markers on each image
-    horiz_triplet = [
-        (s_left.horizontal.left,   s_left.horizontal.top,   plot_radius),
-        (s_center.horizontal.left, s_center.horizontal.top, plot_radius),
-        (s_right.horizontal.left,  s_right.horizontal.top,  plot_radius),
-    ]
+    horiz_triplet = s_comb_bot.markers(_HORIZONTAL, plot_radius)
     s_comb_bot = _insert_markers_on_planes(s_comb_bot, radius_px=plot_radius, multi_mark_horizontal=horiz_triplet)
 
     # Optional top if vert_span is provided
     s_comb_top = None
-    if center_top is not None:
-        s_left_t   = S_at(left_top)
-        s_center_t = S_at(center_top)
-        s_right_t  = S_at(right_top)
+    if has_top:
+        s_left_t, s_center_t, s_right_t = results[3:]
         s_comb_top = _consolidate(s_left_t, s_center_t, s_right_t)
 
-        horiz_triplet_t = [
-            (s_left_t.horizontal.left,   s_left_t.horizontal.top,   plot_radius),
-            (s_center_t.horizontal.left, s_center_t.horizontal.top, plot_radius),
-            (s_right_t.horizontal.left,  s_right_t.horizontal.top,  plot_radius),
-        ]
+        horiz_triplet_t = s_comb_top.markers(_HORIZONTAL, plot_radius)
         s_comb_top = _insert_markers_on_planes(s_comb_top, radius_px=plot_radius, multi_mark_horizontal=horiz_triplet_t)
 
     # --- Plotting helpers
-    def _imshow(ax, pil_img, title=None):
-        if pil_img is None:
-            ax.text(0.5, 0.5, "Image unavailable", ha="center", va="center")
-            ax.axis("off")
-            if title:
-                ax.set_title(title)
-            return
-        ax.imshow(pil_img)
+    def _figure(key):
+        """With reuse_figure, reuse the cached figure while it is still open, else build a new one"""
+        cached = plot_implant_coords._fig_cache.get(key)
+        if reuse_figure and cached is not None and plt.fignum_exists(cached[0].number):
+            return cached[0], cached[1], False
+        fig, ax = plt.subplots(figsize=(18, 6))
         ax.axis("off")
-        if title:
-            ax.set_title(title)
+        if reuse_figure:
+            plot_implant_coords._fig_cache[key] = (fig, ax)
+        return fig, ax, True
+
+    def _draw(key, atlas, title):
+        # One composited image: coronal on top row, horizontal below
+        cells = [
+            [entry.coronal.image_marked or entry.coronal.image for entry in atlas.entries],
+            [entry.horizontal.image_marked or entry.horizontal.image for entry in atlas.entries],
+        ]
+        mosaic, centres = _mosaic(cells)
+
+        fig, ax, created = _figure(key)
+        for text in list(ax.texts):
+            text.remove()
+        if mosaic is None:
+            for im in list(ax.images):
+                im.remove()
+            ax.text(0.5, 0.5, "Image unavailable", ha="center", va="center", transform=ax.transAxes)
+        else:
+            if ax.images:
+                # Reused figure: swap the pixels into the existing image artist
+                ax.images[0].set_data(np.asarray(mosaic))
+                ax.images[0].set_extent((-0.5, mosaic.width - 0.5, mosaic.height - 0.5, -0.5))
+            else:
+                ax.imshow(mosaic)
+            for i, row in enumerate(cells):
+                for j, im in enumerate(row):
+                    if im is None:
+                        ax.text(*centres[i][j], "Image unavailable", ha="center", va="center")
+        ax.set_title(title, fontsize=12)
+        if created:
+            fig.tight_layout()
+        else:
+            fig.canvas.draw_idle()
 
     # Bottom figure: 2 rows × 3 columns (coronal on top, horizontal below)
-    fig = plt.figure(figsize=(18, 6))
-    axes = [plt.subplot(2, 3, i) for i in range(1, 7)]
+    _draw("bottom", s_comb_bot, f"Bottom Electrode Locations {angle}°")
 
-    for j, entry in enumerate(s_comb_bot.entries):
-        _imshow(axes[j], entry.coronal.image_marked or entry.coronal.image)
-    for j, entry in enumerate(s_comb_bot.entries):
-        _imshow(axes[3 + j], entry.horizontal.image_marked or entry.horizontal.image)
+    # Top figure if required; a reused top figure from an earlier call would otherwise show stale data
+    if s_comb_top is not None:
+        _draw("top", s_comb_top, f"Top Electrode Locations {angle}°")
+    elif reuse_figure and "top" in plot_implant_coords._fig_cache:
+        plt.close(plot_implant_coords._fig_cache.pop("top")[0])
 
-    axes[1].set_title(f"Bottom Electrode Locations {angle}°", fontsize=12)
+    return s_comb_bot, s_comb_top
 
-    # Top figure if required
-    if s_comb_top is not None:
-        fig2 = plt.figure(figsize=(18, 6))
-        axes2 = [plt.subplot(2, 3, i) for i in range(1, 7)]
-        for j, entry in enumerate(s_comb_top.entries):
-            _imshow(axes2[j], entry.coronal.image_marked or entry.coronal.image)
-        for j, entry in enumerate(s_comb_top.entries):
-            _imshow(axes2[3 + j], entry.horizontal.image_marked or entry.horizontal.image)
-        axes2[1].set_title(f"Top Electrode Locations {angle}°", fontsize=12)
-
-    plt.tight_layout()
-    return s_comb_bot, s_comb_top
\ No newline at end of file
+# Figures kept open between reuse_figure calls, keyed by "bottom"/"top"
+plot_implant_coords._fig_cache = {}